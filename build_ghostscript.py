@@ -1,13 +1,19 @@
 #!/usr/bin/env python3
 import os
+import re
 import sys
 import subprocess
+import contextlib
+import urllib.error
 import urllib.request
 import tarfile
 import shutil
 import tempfile
 import argparse
+import collections
+import concurrent.futures
 import time
+import platform
 import hashlib
 from pathlib import Path
 from urllib.parse import urlparse
@@ -23,66 +29,646 @@ def log_progress(message, start_time=None):
         print(f"[{timestamp}] {message}")
 
 
+HTTP_TIMEOUT = 60  # Seconds without data before a download is considered stalled
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB reads keep syscall count low on large tarballs
+COPY_BUFSIZE = 2 * 1024 * 1024  # Userspace copy fallback buffer (shutil defaults to 64KB)
+EXTRACT_QUEUE_SIZE = 64  # Max extracted files buffered in memory awaiting a writer
+OUTPUT_TAIL_LINES = 200  # Lines of streamed command output kept for error reports
+RAM_DISK_MAX_MB = 6144  # Source tree plus object files comfortably fit in 6GB
+RAM_DISK_MIN_MB = 2048  # Anything smaller risks running out of space mid-build
+RAM_DISK_CI_MB = 3072  # Size that has always worked on GitHub's macOS runners
+RAM_DISK_HEADROOM_MB = 2048  # Memory left for compilers and the rest of the system
+CACHE_DIR = Path.home() / ".cache" / "ghostscript_build"
+
+GS_URL = "https://github.com/ArtifexSoftware/ghostpdl-downloads/releases/download/gs10051/ghostscript-10.05.1.tar.gz"
+
+# Published SHA-256 of the Ghostscript source tarball, checked on download
+# and on cache hits. Not pinned yet: while None, nothing is verified and the
+# .sha256 files only record what was downloaded. A cached tarball that fails
+# to extract is still discarded and downloaded again.
+GS_TARBALL_SHA256 = None
+
+
+def open_url(url, headers=None):
+    """Open a URL with urllib, which follows redirects and honours HTTP(S)_PROXY"""
+    request = urllib.request.Request(url, headers=headers or {})
+    return urllib.request.urlopen(request, timeout=HTTP_TIMEOUT)
+
+
 def download_file_with_progress(url, dest_path):
-    """Download file from URL with progress indication"""
+    """Download file from URL with progress indication, resuming partial downloads
+
+    Data is streamed into a ``.part`` file next to dest_path, which is renamed
+    into place once complete. Returns the SHA-256 hex digest of the file.
+    """
     start_time = time.time()
-    log_progress(f"📥 Starting download: {url}")
-
-    def progress_hook(block_num, block_size, total_size):
-        if total_size > 0:
-            percent = min(100.0, (block_num * block_size) / total_size * 100)
-            if (
-                block_num % 50 == 0 or percent >= 100
-            ):  # Update every ~50 blocks or at completion
-                print(
-                    f"    Progress: {percent:.1f}% ({block_num * block_size // 1024 // 1024}MB)",
-                    end="\r",
+    dest_path = Path(dest_path)
+    part_path = dest_path.with_name(dest_path.name + ".part")
+
+    existing_size = part_path.stat().st_size if part_path.exists() else 0
+    headers = {"Range": f"bytes={existing_size}-"} if existing_size else {}
+
+    sha256 = hashlib.sha256()
+    try:
+        with open_url(url, headers) as resp:
+            if existing_size and resp.status == 206:
+                log_progress(
+                    f"📥 Resuming download at {existing_size // 1024 // 1024}MB: {url}"
                 )
+                # Hash the bytes we already have so the digest covers the whole file
+                with open(part_path, "rb") as f:
+                    while chunk := f.read(DOWNLOAD_CHUNK_SIZE):
+                        sha256.update(chunk)
+                mode = "ab"
+            else:
+                # Fresh download, or the server ignored the Range header
+                log_progress(f"📥 Starting download: {url}")
+                existing_size = 0
+                mode = "wb"
+
+            content_length = int(resp.headers.get("Content-Length") or 0)
+            total_size = existing_size + content_length if content_length else 0
+            downloaded = existing_size
+
+            with open(part_path, mode) as f:
+                while chunk := resp.read(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                    sha256.update(chunk)
+                    downloaded += len(chunk)
+                    if total_size > 0:
+                        percent = min(100.0, downloaded / total_size * 100)
+                        print(
+                            f"    Progress: {percent:.1f}% ({downloaded // 1024 // 1024}MB)",
+                            end="\r",
+                        )
+    except urllib.error.HTTPError as e:
+        if e.code != 416 or not existing_size:
+            raise
+        # Partial file is unusable for resuming (e.g. already complete), start over
+        log_progress("⚠️  Server rejected resume request, restarting download")
+        part_path.unlink()
+        return download_file_with_progress(url, dest_path)
 
-    urllib.request.urlretrieve(url, dest_path, progress_hook)
     print()  # New line after progress
+    part_path.replace(dest_path)
     log_progress(f"✅ Download completed: {dest_path}", start_time)
+    return sha256.hexdigest()
 
 
 def get_cache_path(url):
     """Get cache file path based on URL hash"""
-    cache_dir = Path.home() / ".cache" / "ghostscript_build"
-    cache_dir.mkdir(parents=True, exist_ok=True)
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
     url_hash = hashlib.sha256(url.encode()).hexdigest()[:12]
     filename = Path(urlparse(url).path).name
-    return cache_dir / f"{url_hash}_{filename}"
+    return CACHE_DIR / f"{url_hash}_{filename}"
 
 
-def extract_tarball_with_progress(tar_path, extract_to):
-    """Extract tarball to specified directory with progress tracking"""
-    start_time = time.time()
-    log_progress(f"📂 Starting extraction: {tar_path}")
+def get_checksum_path(cache_path):
+    """Get path of the SHA-256 file stored alongside a cached download"""
+    return cache_path.with_name(cache_path.name + ".sha256")
+
 
-    with tarfile.open(tar_path, "r:gz") as tar:
-        members = tar.getmembers()
-        total_files = len(members)
+def get_zstd_cache_path(cache_path):
+    """Get path of the zstd-recompressed copy of a cached .tar.gz"""
+    return cache_path.with_name(cache_path.name.removesuffix(".gz") + ".zst")
 
-        for i, member in enumerate(members):
-            tar.extract(member, extract_to)
-            if i % 100 == 0 or i == total_files - 1:  # Update every 100 files
-                percent = (i + 1) / total_files * 100
+
+def zstd_available():
+    """Check whether cached tarballs can be recompressed and extracted with zstd"""
+    return shutil.which("zstd") is not None and shutil.which("tar") is not None
+
+
+def get_extracted_cache_path(url):
+    """Get path of the cached, already extracted source tree for a tarball URL"""
+    filename = Path(urlparse(url).path).name
+    return CACHE_DIR / "extracted" / filename.split(".tar")[0]
+
+
+def file_sha256(path):
+    """Compute SHA-256 hex digest of a file in a single streaming pass"""
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(DOWNLOAD_CHUNK_SIZE):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def record_checksum(cache_path, digest, expected_sha256=None):
+    """Store a downloaded file's digest next to it, rejecting a mismatch with the pin"""
+    if expected_sha256 and digest != expected_sha256:
+        cache_path.unlink()
+        raise RuntimeError(
+            f"Checksum mismatch for {cache_path.name}: "
+            f"expected {expected_sha256}, got {digest}"
+        )
+    get_checksum_path(cache_path).write_text(digest + "\n")
+
+
+def verify_cached_tarball(cache_path, expected_sha256=None):
+    """Check a cached tarball's recorded SHA-256 against the pinned one
+
+    The file is only hashed when no digest has been recorded yet (caches from
+    older runs); afterwards the recorded digest is compared, not the file
+    itself. Without expected_sha256 this only checks that the file exists.
+    """
+    if not cache_path.exists():
+        return False
+
+    checksum_path = get_checksum_path(cache_path)
+    if checksum_path.exists():
+        recorded = checksum_path.read_text().strip()
+        return expected_sha256 is None or recorded == expected_sha256
+
+    log_progress(f"🔐 Hashing cached file: {cache_path}")
+    digest = file_sha256(cache_path)
+    if expected_sha256 and digest != expected_sha256:
+        return False
+    checksum_path.write_text(digest + "\n")
+    return True
+
+
+def find_cached_tarball(cache_path, expected_sha256=None):
+    """Get the cached copy of a tarball, preferring the zstd one
+
+    Copies whose digest doesn't match expected_sha256 are removed. Returns
+    None on a cache miss.
+    """
+    zst_path = get_zstd_cache_path(cache_path)
+    if zst_path.exists() and zstd_available():
+        # The .zst records the digest of the upstream .tar.gz it was made
+        # from; zstd also checks each frame's content checksum while
+        # decompressing
+        checksum_path = get_checksum_path(zst_path)
+        if checksum_path.exists() and (
+            expected_sha256 is None
+            or checksum_path.read_text().strip() == expected_sha256
+        ):
+            return zst_path
+        log_progress("⚠️  Cached zstd file does not match the pinned SHA-256, discarding it")
+        zst_path.unlink()
+        checksum_path.unlink(missing_ok=True)
+
+    if cache_path.exists():
+        if verify_cached_tarball(cache_path, expected_sha256):
+            return cache_path
+        log_progress("⚠️  Cached file does not match the pinned SHA-256, re-downloading")
+        cache_path.unlink()
+        get_checksum_path(cache_path).unlink(missing_ok=True)
+
+    return None
+
+
+def recompress_with_zstd(cache_path, expected_sha256=None):
+    """Replace a cached .tar.gz with a .tar.zst, which decompresses much faster
+
+    The .tar.gz is hashed once more first, and its digest is stored with the
+    .tar.zst so later cache hits can still be compared against the pin.
+    """
+    start_time = time.time()
+    zst_path = get_zstd_cache_path(cache_path)
+    checksum_path = get_checksum_path(cache_path)
+    digest = file_sha256(cache_path)
+    # Compare against the pin, or failing that the digest recorded on download
+    expected = expected_sha256
+    if expected is None and checksum_path.exists():
+        expected = checksum_path.read_text().strip()
+    if expected and digest != expected:
+        log_progress("⚠️  Cached file does not match its SHA-256, not recompressing")
+        return
+
+    staging_path = zst_path.with_name(zst_path.name + ".tmp")
+    log_progress(f"🗜️  Recompressing cache with zstd: {zst_path}")
+
+    with open(staging_path, "wb") as dst:
+        gunzip = subprocess.Popen(
+            ["gzip", "-dc", str(cache_path)], stdout=subprocess.PIPE
+        )
+        zstd = subprocess.Popen(
+            ["zstd", "-3", "-T0", "-q", "-c"], stdin=gunzip.stdout, stdout=dst
+        )
+        gunzip.stdout.close()
+        if zstd.wait() != 0 or gunzip.wait() != 0:
+            staging_path.unlink(missing_ok=True)
+            log_progress("⚠️  zstd recompression failed, keeping gzip cache")
+            return
+
+    staging_path.replace(zst_path)
+    get_checksum_path(zst_path).write_text(digest + "\n")
+    cache_path.unlink()
+    checksum_path.unlink(missing_ok=True)
+    log_progress("✅ Recompression completed", start_time)
+
+
+def get_build_env(use_ccache):
+    """Get environment for configure/make, pointing ccache at the build cache"""
+    env = os.environ.copy()
+    if use_ccache:
+        env.setdefault("CCACHE_DIR", str(CACHE_DIR / "ccache"))
+        env.setdefault("CCACHE_MAXSIZE", "5G")
+    return env
+
+
+def write_extracted_file(path, data, mode, mtime):
+    """Write one extracted regular file and restore its permissions and mtime"""
+    with open(path, "wb", buffering=DOWNLOAD_CHUNK_SIZE) as f:
+        f.write(data)
+    os.chmod(path, mode & 0o7777)
+    # make relies on timestamps; keep the archive's so nothing looks stale
+    os.utime(path, (mtime, mtime))
+
+
+def get_extract_path(extract_to, name):
+    """Get where an archive member is extracted, refusing paths outside extract_to
+
+    The parent directory is resolved so that a symlinked directory extracted
+    earlier can't redirect later members out of the tree.
+    """
+    root = os.path.realpath(extract_to)
+    path = os.path.join(root, name)
+    parent = os.path.realpath(os.path.dirname(path))
+    if os.path.commonpath([root, parent]) != root:
+        raise RuntimeError(f"Refusing to extract unsafe path: {name}")
+    return os.path.join(parent, os.path.basename(path))
+
+
+def extract_with_tarfile(fileobj, extract_to, total_size=0):
+    """Extract a gzipped tar stream in a single sequential pass using tarfile
+
+    The archive is read on the calling thread (tar streams are sequential),
+    while regular files are written out by a thread pool so file creation
+    overlaps with decompression. At most EXTRACT_QUEUE_SIZE files are held
+    in memory at once. Progress is reported from the compressed bytes
+    consumed, which fileobj exposes through tell().
+    """
+    start_time = time.time()
+    count = 0
+    pending = collections.deque()
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=os.cpu_count() or 4
+    ) as pool, tarfile.open(
+        fileobj=fileobj,
+        mode="r|gz",
+        bufsize=DOWNLOAD_CHUNK_SIZE,
+    ) as tar:
+        for member in tar:
+            path = get_extract_path(extract_to, member.name)
+
+            if member.isreg():
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                data = tar.extractfile(member).read()
+                if len(pending) >= EXTRACT_QUEUE_SIZE:
+                    pending.popleft().result()  # Back-pressure on the reader
+                pending.append(
+                    pool.submit(
+                        write_extracted_file, path, data, member.mode, member.mtime
+                    )
+                )
+            elif member.isdir():
+                os.makedirs(path, exist_ok=True)
+            else:
+                # Links may refer to files still queued for writing
+                while pending:
+                    pending.popleft().result()
+                # The "data" filter rejects links pointing outside extract_to
+                # (available from Python 3.12 and in later 3.9-3.11 patches)
+                if hasattr(tarfile, "data_filter"):
+                    tar.extract(member, extract_to, filter="data")
+                else:
+                    tar.extract(member, extract_to)
+
+            count += 1
+            if count % 500 == 0:  # Update every 500 files
+                read_mb = fileobj.tell() // 1024 // 1024
+                if total_size > 0:
+                    percent = min(100.0, fileobj.tell() / total_size * 100)
+                    status = f"{percent:.1f}% ({read_mb}MB read)"
+                else:
+                    status = f"{read_mb}MB read"
                 print(
-                    f"    Extracting: {percent:.1f}% ({i + 1}/{total_files} files)",
+                    f"    Extracting: {status}, {count} files, "
+                    f"{time.time() - start_time:.0f}s elapsed",
                     end="\r",
                 )
 
-        print()  # New line after progress
+        # Surface any write errors before reporting success
+        while pending:
+            pending.popleft().result()
+
+    print()  # New line after progress
+
+
+def extract_with_system_tar(fileobj, extract_to, total_size=0):
+    """Extract a gzipped tar stream by piping it into the system tar
+
+    Native tar avoids tarfile's per-member Python overhead, so the stream is
+    just copied into its stdin in large chunks.
+    """
+    start_time = time.time()
+    piped = 0
+    process = subprocess.Popen(
+        ["tar", "-xzf", "-", "-C", str(extract_to)], stdin=subprocess.PIPE
+    )
+
+    try:
+        while chunk := fileobj.read(DOWNLOAD_CHUNK_SIZE):
+            process.stdin.write(chunk)
+            piped += len(chunk)
+            if total_size > 0:
+                status = f"{min(100.0, piped / total_size * 100):.1f}%"
+            else:
+                status = f"{piped // 1024 // 1024}MB"
+            print(
+                f"    Extracting: {status}, {time.time() - start_time:.0f}s elapsed",
+                end="\r",
+            )
+    except BrokenPipeError:
+        pass  # tar exited early; its exit status below explains why
+    except BaseException:
+        # Stop tar before the caller removes the directory it writes into
+        process.kill()
+        raise
+    finally:
+        # Closing flushes buffered data, which fails again if tar is gone
+        with contextlib.suppress(BrokenPipeError):
+            process.stdin.close()
+        process.wait()
+
+    print()  # New line after progress
+    if process.returncode != 0:
+        raise RuntimeError(f"tar extraction failed (exit code {process.returncode})")
+
+
+def extract_tar_stream(fileobj, extract_to, total_size=0):
+    """Extract a gzipped tar stream, preferring the system tar over tarfile"""
+    if shutil.which("tar"):
+        extract_with_system_tar(fileobj, extract_to, total_size)
+    else:
+        extract_with_tarfile(fileobj, extract_to, total_size)
+
+
+def extract_zstd_tarball(tar_path, extract_to):
+    """Extract a .tar.zst by piping zstd's output straight into the system tar"""
+    zstd = subprocess.Popen(
+        ["zstd", "-dcq", str(tar_path)], stdout=subprocess.PIPE
+    )
+    tar = subprocess.Popen(
+        ["tar", "-xf", "-", "-C", str(extract_to)], stdin=zstd.stdout
+    )
+    zstd.stdout.close()  # Let zstd see a broken pipe if tar exits early
+    if tar.wait() != 0 or zstd.wait() != 0:
+        raise RuntimeError(
+            f"zstd extraction failed (zstd exit code {zstd.returncode}, "
+            f"tar exit code {tar.returncode})"
+        )
+
+
+def extract_tarball_with_progress(tar_path, extract_to):
+    """Extract tarball to specified directory with progress tracking"""
+    start_time = time.time()
+    log_progress(f"📂 Starting extraction: {tar_path}")
+
+    if str(tar_path).endswith(".zst"):
+        extract_zstd_tarball(tar_path, extract_to)
+    else:
+        # Buffer the compressed input so gzip pulls 1MB per read() syscall
+        with open(tar_path, "rb", buffering=DOWNLOAD_CHUNK_SIZE) as f:
+            extract_tar_stream(f, extract_to, os.path.getsize(tar_path))
     log_progress("✅ Extraction completed", start_time)
 
 
+class TeeReader:
+    """File-like wrapper that copies everything read from a stream into a sink"""
+
+    def __init__(self, source, sink):
+        self.source = source
+        self.sink = sink
+        self.sha256 = hashlib.sha256()
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        data = self.source.read(size)
+        self.sink.write(data)
+        self.sha256.update(data)
+        self.bytes_read += len(data)
+        return data
+
+    def tell(self):
+        return self.bytes_read
+
+
+def extract_cached_tarball(tar_path, extract_to):
+    """Extract a cached tarball, discarding it if it turns out to be unusable
+
+    A recorded digest only proves the file hasn't changed since it was
+    downloaded, not that the download was a valid tarball. Returns False
+    after removing the tarball, its digest and anything partially extracted.
+    """
+    try:
+        extract_tarball_with_progress(tar_path, extract_to)
+        return True
+    except Exception as e:
+        log_progress(f"⚠️  Cached file could not be extracted ({e}), re-downloading")
+
+    tar_path.unlink(missing_ok=True)
+    get_checksum_path(tar_path).unlink(missing_ok=True)
+    for item in Path(extract_to).iterdir():
+        if item.is_dir() and not item.is_symlink():
+            shutil.rmtree(item)
+        else:
+            item.unlink()
+    return False
+
+
+def download_and_extract_streaming(url, extract_to, cache_path, expected_sha256=None):
+    """Download a tarball and extract it in a single pass, caching it on the way
+
+    The HTTP response is decompressed and unpacked as it arrives instead of
+    being written to disk and read back. On a cache hit the cached tarball is
+    extracted; an interrupted earlier download is resumed first, and either
+    is downloaded again if it fails to extract. The digest of every download
+    is recorded next to the cached file and checked against expected_sha256
+    when given. Returns the SHA-256 hex digest when the tarball was
+    downloaded, otherwise None.
+    """
+    cache_path = Path(cache_path)
+    part_path = cache_path.with_name(cache_path.name + ".part")
+
+    cached_tarball = find_cached_tarball(cache_path, expected_sha256)
+    if cached_tarball:
+        log_progress(f"📦 Using cached file: {cached_tarball}")
+        if extract_cached_tarball(cached_tarball, extract_to):
+            return None
+    elif part_path.exists():
+        log_progress("📦 Found partial download, resuming")
+        digest = download_file_with_progress(url, cache_path)
+        record_checksum(cache_path, digest, expected_sha256)
+        if extract_cached_tarball(cache_path, extract_to):
+            return digest
+
+    start_time = time.time()
+    log_progress(f"📥 Streaming download and extraction: {url}")
+
+    with open_url(url) as resp, open(part_path, "wb") as cache_file:
+        tee = TeeReader(resp, cache_file)
+        content_length = int(resp.headers.get("Content-Length") or 0)
+        extract_tar_stream(tee, extract_to, content_length)
+        # Extraction may stop at the end-of-archive marker; keep the trailing
+        # padding so the cached copy is byte-identical to the download
+        while tee.read(DOWNLOAD_CHUNK_SIZE):
+            pass
+
+    part_path.replace(cache_path)
+    digest = tee.sha256.hexdigest()
+    record_checksum(cache_path, digest, expected_sha256)
+    log_progress(f"✅ Download and extraction completed: {cache_path}", start_time)
+    return digest
+
+
+def cache_extracted_source(cache_path, extracted_cache, expected_sha256=None):
+    """Recompress the cached tarball and unpack a pristine source tree from it
+
+    Meant to run in the background while the build uses its own working
+    copy, so failures are logged rather than raised.
+    """
+    try:
+        if zstd_available() and cache_path.exists():
+            recompress_with_zstd(cache_path, expected_sha256)
+
+        tarball = find_cached_tarball(cache_path, expected_sha256)
+        if tarball is None:
+            return
+
+        staging_dir = extracted_cache.with_name(extracted_cache.name + ".tmp")
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        staging_dir.mkdir(parents=True)
+        extract_tarball_with_progress(tarball, staging_dir)
+
+        source_dir = staging_dir / extracted_cache.name
+        if not source_dir.is_dir():
+            raise RuntimeError(f"{extracted_cache.name} not found in {tarball.name}")
+
+        # Rename into place so an interrupted extraction is never mistaken
+        # for a cache hit
+        shutil.rmtree(extracted_cache, ignore_errors=True)
+        source_dir.rename(extracted_cache)
+        shutil.rmtree(staging_dir)
+        log_progress(f"💾 Cached for future builds: {extracted_cache}")
+    except Exception as e:
+        log_progress(f"⚠️  Could not cache extracted source tree: {e}")
+
+
+def kernel_copy(method, src_fd, dst_fd, size):
+    """Copy size bytes between file descriptors without going through userspace"""
+    offset = 0
+    while offset < size:
+        if method == "copy_file_range":
+            sent = os.copy_file_range(src_fd, dst_fd, size - offset, offset, offset)
+        else:
+            sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+        if sent == 0:
+            break
+        offset += sent
+    return offset == size
+
+
+def fast_copy(src, dst):
+    """Copy a file like shutil.copy2, keeping the data copy inside the kernel
+
+    On Linux copy_file_range (5.3+, can share extents on CoW filesystems) is
+    tried first, then sendfile. Other platforms use shutil.copy2, which
+    already uses fcopyfile on macOS.
+    """
+    if not sys.platform.startswith("linux"):
+        return shutil.copy2(src, dst)
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        copied = False
+        for method in ("copy_file_range", "sendfile"):
+            if not hasattr(os, method):
+                continue
+            try:
+                copied = kernel_copy(method, fsrc.fileno(), fdst.fileno(), size)
+            except OSError:
+                copied = False
+            if copied:
+                break
+            # Start over with the next method
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+        if not copied:
+            shutil.copyfileobj(fsrc, fdst, COPY_BUFSIZE)
+
+    shutil.copystat(src, dst)
+    return dst
+
+
+def link_or_copy(src, dst):
+    """Hard-link src to dst, falling back to a copy across filesystems"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        # EXDEV when the cache and source live on different filesystems
+        # (e.g. the RAM disk), or the filesystem has no hard links
+        fast_copy(src, dst)
+    return dst
+
+
+def cache_directory(source_dir, cache_dir, copy_function=fast_copy):
+    """Store a copy of a directory tree in the build cache for later runs"""
+    staging_dir = cache_dir.with_name(cache_dir.name + ".tmp")
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    shutil.copytree(
+        source_dir, staging_dir, symlinks=True, copy_function=copy_function
+    )
+    # Rename into place so an interrupted copy is never mistaken for a cache hit
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    staging_dir.rename(cache_dir)
+    log_progress(f"💾 Cached for future builds: {cache_dir}")
+
+
+def get_available_memory_mb():
+    """Get available physical memory in MB, or None if it can't be determined"""
+    try:
+        if sys.platform.startswith("linux"):
+            with open("/proc/meminfo") as f:
+                for line in f:
+                    if line.startswith("MemAvailable:"):
+                        return int(line.split()[1]) // 1024
+        elif sys.platform == "darwin":
+            output = subprocess.run(
+                ["vm_stat"], capture_output=True, text=True, check=True
+            ).stdout
+            page_size = int(re.search(r"page size of (\d+) bytes", output).group(1))
+            pages = 0
+            # Inactive and speculative pages are reclaimable on demand
+            for label in ("Pages free", "Pages inactive", "Pages speculative"):
+                match = re.search(rf"{label}:\s+(\d+)", output)
+                if match:
+                    pages += int(match.group(1))
+            return pages * page_size // 1024 // 1024
+    except (OSError, ValueError, AttributeError, subprocess.CalledProcessError):
+        pass
+    return None
+
+
 def get_optimal_ram_disk_size():
-    """Determine optimal RAM disk size for GitHub Mac runners"""
-    # GitHub Actions Mac runners have 14GB RAM
-    # Use 3GB for optimal performance without overwhelming the system
-    if os.environ.get("GITHUB_ACTIONS") == "true":
-        return 3072  # 3GB for GitHub Actions Mac runners
-    else:
-        return 2048  # 2GB for local development
+    """Determine optimal RAM disk size from the memory actually available"""
+    available_mb = get_available_memory_mb()
+    if available_mb is None:
+        # Fall back to fixed sizes known to work on GitHub Mac runners
+        if os.environ.get("GITHUB_ACTIONS") == "true":
+            return RAM_DISK_CI_MB
+        else:
+            return 2048  # 2GB for local development
+
+    # A quarter of available memory, but never below the size known to work
+    # on CI runners, as long as that still leaves headroom for compilers
+    usable_mb = available_mb - RAM_DISK_HEADROOM_MB
+    size_mb = min(RAM_DISK_MAX_MB, max(available_mb // 4, RAM_DISK_CI_MB))
+    return max(0, min(size_mb, usable_mb))
 
 
 def setup_ram_disk(size_mb=None):
@@ -90,6 +676,12 @@ def setup_ram_disk(size_mb=None):
     if size_mb is None:
         size_mb = get_optimal_ram_disk_size()
 
+    if size_mb < RAM_DISK_MIN_MB:
+        log_progress(
+            f"⚠️  Not enough free memory for a RAM disk ({size_mb}MB), using regular disk"
+        )
+        return None, None
+
     try:
         if sys.platform == "darwin":  # macOS
             # Create RAM disk
@@ -119,6 +711,9 @@ def setup_ram_disk(size_mb=None):
         log_progress(f"⚠️  RAM disk setup failed, using regular disk: {e}")
         return None, None
 
+    log_progress("⚠️  RAM disk not supported on this platform, using regular disk")
+    return None, None
+
 
 def cleanup_ram_disk(ram_disk_path, device):
     """Clean up RAM disk"""
@@ -131,20 +726,25 @@ def cleanup_ram_disk(ram_disk_path, device):
             log_progress(f"⚠️  RAM disk cleanup failed: {e}")
 
 
-def run_command_with_progress(cmd, cwd=None, check=True, description=None):
-    """Run shell command with progress tracking and better error handling"""
+def run_command_with_progress(cmd, cwd=None, check=True, description=None, env=None):
+    """Run command with progress tracking and better error handling
+
+    cmd must be an argument list; commands are never run through a shell.
+    """
+    assert not isinstance(cmd, str), "cmd must be a list of arguments"
     start_time = time.time()
-    cmd_str = " ".join(cmd) if isinstance(cmd, list) else cmd
+    cmd_str = " ".join(cmd)
     desc = description or f"Running: {cmd_str}"
     log_progress(f"🔄 {desc}")
 
     try:
-        # For long-running commands like make, show periodic updates
-        if isinstance(cmd, list) and cmd[0] == "make":
+        # For long-running, chatty commands like make and configure, stream
+        # the output and show periodic updates instead of buffering it all
+        if cmd[0] in ("make", "./configure"):
             process = subprocess.Popen(
                 cmd,
-                shell=False,
                 cwd=cwd,
+                env=env,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 text=True,
@@ -152,7 +752,9 @@ def run_command_with_progress(cmd, cwd=None, check=True, description=None):
                 universal_newlines=True,
             )
 
-            output_lines = []
+            # Only the tail is needed for error reporting
+            output_lines = collections.deque(maxlen=OUTPUT_TAIL_LINES)
+            line_count = 0
             while True:
                 if process.stdout is None:
                     break
@@ -161,25 +763,28 @@ def run_command_with_progress(cmd, cwd=None, check=True, description=None):
                     break
                 if output:
                     output_lines.append(output.strip())
+                    line_count += 1
                     # Show progress every 10 seconds or on certain keywords
                     elapsed = time.time() - start_time
-                    if (len(output_lines) % 20 == 0 and elapsed > 10) or any(
+                    if (line_count % 20 == 0 and elapsed > 10) or any(
                         keyword in output.lower()
                         for keyword in ["compiling", "linking", "building"]
                     ):
                         print(
-                            f"    Build progress: {elapsed:.0f}s elapsed, {len(output_lines)} operations completed"
+                            f"    Build progress: {elapsed:.0f}s elapsed, {line_count} operations completed"
                         )
 
             result_code = process.poll()
             if result_code is None:
                 result_code = 0
-            if result_code != 0 and check:
-                raise subprocess.CalledProcessError(
-                    result_code, cmd, "\n".join(output_lines[-20:])
-                )
-
-            log_progress(f"✅ {desc}", start_time)
+            if result_code != 0:
+                if check:
+                    raise subprocess.CalledProcessError(
+                        result_code, cmd, "\n".join(output_lines)
+                    )
+                log_progress(f"❌ {desc} (exit code {result_code})", start_time)
+            else:
+                log_progress(f"✅ {desc}", start_time)
             return type(
                 "Result",
                 (),
@@ -188,24 +793,46 @@ def run_command_with_progress(cmd, cwd=None, check=True, description=None):
         else:
             result = subprocess.run(
                 cmd,
-                shell=isinstance(cmd, str),
                 cwd=cwd,
+                env=env,
                 check=check,
                 capture_output=True,
                 text=True,
             )
-            log_progress(f"✅ {desc}", start_time)
+            if result.returncode != 0:
+                log_progress(f"❌ {desc} (exit code {result.returncode})", start_time)
+            else:
+                log_progress(f"✅ {desc}", start_time)
             return result
 
     except subprocess.CalledProcessError as e:
         log_progress(f"❌ Command failed: {cmd_str}")
-        if e.stderr:
-            print(f"Error output: {e.stderr}")
+        # Streamed commands only keep the tail of their combined output
+        if e.stderr or e.output:
+            print(f"Error output:\n{e.stderr or e.output}")
         if check:
             raise
         return e
 
 
+def get_cpu_count():
+    """Get the number of CPUs this process may run on"""
+    # The affinity mask reflects cpusets (Linux only), but not CPU quotas
+    if hasattr(os, "sched_getaffinity"):
+        count = len(os.sched_getaffinity(0))
+    else:
+        count = os.cpu_count() or 4
+
+    # A cgroup v2 CPU quota (e.g. docker --cpus=2) caps usable CPUs further
+    try:
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+        if quota != "max":
+            count = min(count, max(1, -(-int(quota) // int(period))))
+    except (OSError, ValueError):
+        pass
+    return count
+
+
 def check_dependencies():
     """Check if required build tools are available with progress tracking"""
     log_progress("🔍 Checking build dependencies")
@@ -213,12 +840,17 @@ def check_dependencies():
     missing = []
 
     for tool in required_tools:
-        try:
-            subprocess.run(["which", tool], check=True, capture_output=True)
-            print(f"    ✅ {tool} found")
-        except subprocess.CalledProcessError:
+        if shutil.which(tool) is None:
             missing.append(tool)
             print(f"    ❌ {tool} missing")
+        else:
+            print(f"    ✅ {tool} found")
+
+    # ccache is optional but makes rebuilds of unchanged sources near-instant
+    if shutil.which("ccache"):
+        print("    ✅ ccache found")
+    else:
+        print("    ⚠️  ccache not found, rebuilds will recompile everything")
 
     if missing:
         log_progress(f"❌ Missing required tools: {', '.join(missing)}")
@@ -230,25 +862,296 @@ def check_dependencies():
         log_progress("✅ All dependencies satisfied")
 
 
-def build_ghostscript(cleanup=True, use_ram_disk=True):
-    """Main function to download and build Ghostscript with performance optimizations"""
-    gs_url = "https://github.com/ArtifexSoftware/ghostpdl-downloads/releases/download/gs10051/ghostscript-10.05.1.tar.gz"
-    total_start_time = time.time()
+def get_optimization_flags():
+    """Get compiler and linker flags for a portable, optimized binary
+
+    The binary is distributed, so target a well-known ISA baseline instead of
+    -march=native, which would bake in whatever the build host supports.
+    """
+    machine = platform.machine().lower()
+    cflags = ["-O3"]
+    if machine in ("arm64", "aarch64"):
+        cflags.append("-march=armv8.2-a+crypto+fp16")
+    elif machine in ("x86_64", "amd64"):
+        # x86-64-v3 still enables AVX2, BMI2 and FMA
+        cflags.extend(["-march=x86-64-v3", "-mtune=generic"])
+    cflags.extend(["-pipe", "-flto=auto"])
+    ldflags = ["-flto=auto"]
+
+    # ELF/GNU ld only; Apple's toolchain rejects these
+    if sys.platform.startswith("linux"):
+        cflags.append("-fno-semantic-interposition")
+        ldflags.extend(["-Wl,-O1", "-Wl,--as-needed"])
+
+    return " ".join(cflags), " ".join(ldflags)
+
+
+# pkg-config modules linked by the --system-libs attempt, mapped to the
+# vendored source directory configure would otherwise build them from.
+# configure only falls back to the system copy when that directory is
+# missing; libtiff is switched by --with-system-libtiff instead, and
+# fontconfig has no vendored copy
+SYSTEM_LIBS = {
+    "zlib": "zlib",
+    "libjpeg": "jpeg",
+    "libpng": "libpng",
+    "freetype2": "freetype",
+    "libtiff-4": None,
+    "fontconfig": None,
+}
+
+
+def system_libs_available():
+    """Check via pkg-config whether the system libraries to link are installed"""
+    if shutil.which("pkg-config") is None:
+        return False
+    result = subprocess.run(
+        ["pkg-config", "--exists", *SYSTEM_LIBS], capture_output=True
+    )
+    return result.returncode == 0
+
+
+def hide_vendored_libs(source_dir):
+    """Move vendored copies of SYSTEM_LIBS aside so configure links the system ones
+
+    Returns (original, hidden) path pairs for restore_vendored_libs.
+    """
+    moved = []
+    for name in filter(None, SYSTEM_LIBS.values()):
+        path = source_dir / name
+        if path.is_dir():
+            hidden = source_dir / f".{name}-vendored"
+            path.rename(hidden)
+            moved.append((path, hidden))
+    return moved
+
+
+def restore_vendored_libs(moved):
+    """Put vendored library sources moved by hide_vendored_libs back in place"""
+    for path, hidden in moved:
+        hidden.rename(path)
+
+
+def get_configure_attempts(prefix, use_system_libs=False):
+    """Get configure command lines to try, in order of preference
+
+    With use_system_libs, the first attempt links SYSTEM_LIBS and must run
+    with the vendored copies hidden (see hide_vendored_libs).
+    """
+    cflags, ldflags = get_optimization_flags()
+    attempts = []
+
+    # Linking the system's shared libraries skips compiling the vendored
+    # copies, but the binary is then no longer standalone, hence opt-in
+    if use_system_libs:
+        attempts.append(
+            [
+                "./configure",
+                f"--prefix={prefix}",
+                "--disable-cups",
+                "--without-x",
+                "--disable-gtk",
+                "--disable-dbus",
+                "--with-system-libtiff",
+                "--enable-dynamic",
+                f"CFLAGS={cflags}",
+                f"CXXFLAGS={cflags}",
+                f"LDFLAGS={ldflags}",
+            ]
+        )
+
+    return attempts + [
+        # Optimized configuration first - disable unnecessary features for speed
+        [
+            "./configure",
+            f"--prefix={prefix}",
+            "--disable-cups",
+            "--without-x",
+            "--disable-gtk",
+            "--without-libtiff",
+            "--without-libpng",
+            "--disable-fontconfig",
+            "--disable-dbus",
+            f"CFLAGS={cflags}",
+            f"CXXFLAGS={cflags}",
+            f"LDFLAGS={ldflags}",
+        ],
+        # Fallback minimal configuration
+        ["./configure", f"--prefix={prefix}"],
+    ]
+
+
+def get_toolchain_fingerprint():
+    """Describe the compiler and host so cached build outputs match the toolchain"""
+    try:
+        compiler = subprocess.run(
+            ["gcc", "--version"], capture_output=True, text=True, check=True
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        compiler = "unknown compiler"
+    return f"{compiler.strip()}\n{sys.platform}\n{platform.machine()}"
 
-    log_progress("🚀 Starting Ghostscript build process")
 
-    # Check dependencies first
-    check_dependencies()
+def get_build_cache_key(url, configure_attempts):
+    """Get cache key for a built prefix from source URL, toolchain and flags"""
+    key_parts = [url, get_toolchain_fingerprint()]
+    key_parts.extend(" ".join(cmd) for cmd in configure_attempts)
+    return hashlib.sha256("\n".join(key_parts).encode()).hexdigest()[:16]
 
-    # Set up RAM disk for faster compilation if requested
-    ram_disk_path, ram_device = None, None
-    if use_ram_disk:
-        ram_disk_path, ram_device = (
-            setup_ram_disk()
-        )  # Dynamic RAM disk size based on system
 
-    # Determine work directory (RAM disk or temp)
-    work_base = ram_disk_path if ram_disk_path else Path(tempfile.gettempdir())
+def get_configure_cache_path(configure_cmd):
+    """Get a persistent autoconf cache file for a configure command line
+
+    autoconf rejects a cache written with different CC/CFLAGS, so every
+    command line and toolchain gets its own file.
+    """
+    cache_dir = CACHE_DIR / "configure"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    key_parts = [get_toolchain_fingerprint(), *configure_cmd]
+    key = hashlib.sha256("\n".join(key_parts).encode()).hexdigest()[:16]
+    return cache_dir / f"config-{key}.cache"
+
+
+def get_prefix_record_path(prefix_cache):
+    """Get path of the file recording which configure command built a cached prefix"""
+    return prefix_cache / "configure-command"
+
+
+def is_reusable_prefix(prefix_cache, configure_cmd):
+    """Check that a cached prefix exists and was built by the given configure command
+
+    Entries built by a fallback attempt, or cached before the winning
+    command was recorded, are rebuilt instead of reused.
+    """
+    record_path = get_prefix_record_path(prefix_cache)
+    return (
+        (prefix_cache / "bin" / "gs").exists()
+        and record_path.exists()
+        and record_path.read_text() == "\n".join(configure_cmd) + "\n"
+    )
+
+
+def prune_build_cache(prefix_cache, config_caches):
+    """Remove cached prefixes and autoconf caches other than the current ones
+
+    Every flag or compiler change adds a new key, and CI restores and saves
+    the whole cache directory, so stale entries would otherwise pile up.
+    """
+    for path in CACHE_DIR.glob("prefix-*"):
+        if path != prefix_cache:
+            shutil.rmtree(path, ignore_errors=True)
+            log_progress(f"🗑️  Removed stale cached build: {path.name}")
+    for path in (CACHE_DIR / "configure").glob("config-*.cache"):
+        if path not in config_caches:
+            path.unlink(missing_ok=True)
+
+
+def strip_binary(binary):
+    """Strip symbols from the final binary and UPX-compress it where supported"""
+    size_before = binary.stat().st_size
+
+    if sys.platform == "darwin":
+        # Apple's strip has no --strip-unneeded; -x removes local symbols
+        strip_cmd = ["strip", "-x", str(binary)]
+    else:
+        strip_cmd = ["strip", "--strip-unneeded", str(binary)]
+    run_command_with_progress(strip_cmd, description="Stripping binary symbols")
+
+    if sys.platform == "darwin":
+        # Stripping invalidates the linker's ad-hoc signature, and arm64
+        # macOS refuses to run unsigned binaries
+        run_command_with_progress(
+            ["codesign", "--force", "--sign", "-", str(binary)],
+            description="Re-signing binary",
+        )
+    elif shutil.which("upx"):
+        # Skipped on macOS, where UPX-packed binaries don't run reliably
+        result = run_command_with_progress(
+            ["upx", "--best", "--lzma", "-q", str(binary)],
+            check=False,
+            description="Compressing binary with UPX",
+        )
+        if result.returncode != 0:
+            log_progress("⚠️  UPX compression failed, keeping stripped binary")
+
+    size_after = binary.stat().st_size
+    log_progress(
+        f"📉 Binary size: {size_before / 1024 / 1024:.1f}MB -> "
+        f"{size_after / 1024 / 1024:.1f}MB"
+    )
+
+
+def install_final_binary(gs_binary, output_dir, strip=False):
+    """Copy the built gs binary to the output directory and test it"""
+    final_binary = output_dir / "ghostscript"
+    log_progress("📋 Copying final binary to output directory")
+    fast_copy(gs_binary, final_binary)
+
+    # Make executable
+    os.chmod(final_binary, 0o755)
+
+    if strip:
+        strip_binary(final_binary)
+
+    log_progress(f"🎉 Standalone Ghostscript binary created: {final_binary.absolute()}")
+
+    # Test the binary
+    log_progress("🧪 Testing binary functionality")
+    result = run_command_with_progress(
+        [str(final_binary), "--version"],
+        check=False,
+        description="Testing binary version",
+    )
+    if result.returncode != 0:
+        log_progress("❌ Binary test failed")
+        raise RuntimeError(f"Binary test failed: {final_binary}")
+
+    log_progress("✅ Binary test successful!")
+
+
+def cleanup_build_artifacts(build_dir, cleanup):
+    """Remove the build directory and leftover test files if requested"""
+    if not cleanup:
+        log_progress("📁 Build artifacts retained (use --cleanup to remove)")
+        return
+
+    log_progress("🧹 Cleaning up build artifacts")
+    if build_dir.exists():
+        shutil.rmtree(build_dir)
+        log_progress(f"🗑️  Removed build directory: {build_dir}")
+
+    # Clean up any test files
+    test_files = [
+        "test.ps",
+        "test_original.pdf",
+        "test_prepress.pdf",
+        "test_printer.pdf",
+        "test_ebook.pdf",
+        "test_screen.pdf",
+        "test_max_compression.pdf",
+        "test_info.pdf",
+    ]
+
+    cleaned_files = []
+    for test_file in test_files:
+        test_path = Path(test_file)
+        if test_path.exists():
+            test_path.unlink()
+            cleaned_files.append(test_file)
+
+    if cleaned_files:
+        log_progress(f"🗑️  Removed test files: {', '.join(cleaned_files)}")
+
+    log_progress("✅ Cleanup completed!")
+
+
+def build_ghostscript(
+    cleanup=True, use_ram_disk=True, use_system_libs=False, strip=False
+):
+    """Main function to download and build Ghostscript with performance optimizations"""
+    total_start_time = time.time()
+
+    log_progress("🚀 Starting Ghostscript build process")
 
     # Create build directory
     build_dir = Path("./build")
@@ -260,30 +1163,78 @@ def build_ghostscript(cleanup=True, use_ram_disk=True):
     output_dir.mkdir(exist_ok=True)
     log_progress(f"📁 Output directory: {output_dir.absolute()}")
 
+    # Skip the whole compile if this source, toolchain and configuration
+    # have been built before
+    use_system_libs = use_system_libs and system_libs_available()
+    configure_attempts = get_configure_attempts(build_dir.absolute(), use_system_libs)
+    cache_key = get_build_cache_key(GS_URL, configure_attempts)
+    prefix_cache = CACHE_DIR / f"prefix-{cache_key}"
+    log_progress(f"🔑 Build cache key: {cache_key}")
+    if GS_TARBALL_SHA256 is None:
+        log_progress("⚠️  No pinned SHA-256 for the source tarball, downloads are not verified")
+
+    if is_reusable_prefix(prefix_cache, configure_attempts[0]):
+        log_progress(f"♻️  Reusing cached build: {prefix_cache}")
+        try:
+            install_final_binary(prefix_cache / "bin" / "gs", output_dir, strip)
+        except RuntimeError:
+            # Don't keep handing out a binary that doesn't run
+            shutil.rmtree(prefix_cache, ignore_errors=True)
+            raise
+        cleanup_build_artifacts(build_dir, cleanup)
+        total_elapsed = time.time() - total_start_time
+        log_progress(f"🏁 Build process completed in {total_elapsed:.1f} seconds")
+        return
+
+    # Check dependencies and set up the RAM disk (if requested) concurrently;
+    # the pool is kept for cache population that overlaps with the build
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+    dependency_check = pool.submit(check_dependencies)
+    ram_disk_setup = pool.submit(setup_ram_disk) if use_ram_disk else None
+
+    # Dynamic RAM disk size based on system
+    ram_disk_path, ram_device = (
+        ram_disk_setup.result() if ram_disk_setup else (None, None)
+    )
+
+    # Determine work directory (RAM disk or temp)
+    work_base = ram_disk_path if ram_disk_path else Path(tempfile.gettempdir())
+
     try:
+        dependency_check.result()
+
         with tempfile.TemporaryDirectory(dir=work_base) as temp_dir:
             temp_path = Path(temp_dir)
             log_progress(
                 f"📁 Working in: {temp_path} {'(RAM disk)' if ram_disk_path else '(regular disk)'}"
             )
 
-            # Check cache first to avoid re-downloading
-            cache_path = get_cache_path(gs_url)
-            tar_path = temp_path / "ghostscript-10.05.1.tar.gz"
+            # Check cache first to avoid re-downloading; on a miss the
+            # download is extracted as it streams in and cached on the way
+            cache_path = get_cache_path(GS_URL)
+            extracted_cache = get_extracted_cache_path(GS_URL)
+            reuse_extracted = (
+                extracted_cache.is_dir()
+                and find_cached_tarball(cache_path, GS_TARBALL_SHA256) is not None
+            )
 
-            if cache_path.exists():
-                log_progress(f"📦 Using cached file: {cache_path}")
-                shutil.copy2(cache_path, tar_path)
+            if reuse_extracted:
+                log_progress(f"♻️  Copying cached source tree: {extracted_cache}")
+                # Copied rather than hard-linked: configure and make write
+                # into the tree and must not touch the cached copy
+                shutil.copytree(
+                    extracted_cache,
+                    temp_path / extracted_cache.name,
+                    symlinks=True,
+                    copy_function=fast_copy,
+                )
             else:
-                log_progress("📦 No cache found, downloading fresh")
-                # Download Ghostscript source
-                download_file_with_progress(gs_url, tar_path)
-                # Cache the downloaded file
-                shutil.copy2(tar_path, cache_path)
-                log_progress(f"💾 Cached for future builds: {cache_path}")
-
-            # Extract source with progress
-            extract_tarball_with_progress(tar_path, temp_path)
+                digest = download_and_extract_streaming(
+                    GS_URL, temp_path, cache_path, GS_TARBALL_SHA256
+                )
+                if digest:
+                    log_progress(f"💾 Cached for future builds: {cache_path}")
+                    log_progress(f"🔐 SHA-256: {digest}")
 
             # Find extracted directory
             gs_source_dir = None
@@ -298,56 +1249,82 @@ def build_ghostscript(cleanup=True, use_ram_disk=True):
 
             log_progress(f"📂 Found source directory: {gs_source_dir.name}")
 
-            # Try different configure approaches with optimizations
-            configure_attempts = [
-                # Optimized configuration first - disable unnecessary features for speed
-                [
-                    "./configure",
-                    f"--prefix={build_dir.absolute()}",
-                    "--disable-cups",
-                    "--without-x",
-                    "--disable-gtk",
-                    "--without-libtiff",
-                    "--without-libpng",
-                    "--disable-fontconfig",
-                    "--disable-dbus",
-                    "CFLAGS=-O3 -march=native -pipe",
-                    "CXXFLAGS=-O3 -march=native -pipe",
-                ],
-                # Fallback minimal configuration
-                ["./configure", f"--prefix={build_dir.absolute()}"],
-            ]
+            # Unpack a pristine source tree into the cache in the background,
+            # overlapping with configure and make on the working copy
+            if not reuse_extracted:
+                pool.submit(
+                    cache_extracted_source, cache_path, extracted_cache, GS_TARBALL_SHA256
+                )
+
+            # Route compiles through ccache when available so unchanged
+            # translation units are reused across builds
+            use_ccache = shutil.which("ccache") is not None
+            compiler_args = ["CC=ccache gcc", "CXX=ccache g++"] if use_ccache else []
+            build_env = get_build_env(use_ccache)
 
-            configure_success = False
+            successful_attempt = None
             for i, configure_cmd in enumerate(configure_attempts):
+                configure_cmd = [configure_cmd[0], *compiler_args, *configure_cmd[1:]]
+                hidden_libs = (
+                    hide_vendored_libs(gs_source_dir)
+                    if use_system_libs and i == 0
+                    else []
+                )
+                # Reuse feature probe results from earlier runs of this command
+                config_cache = get_configure_cache_path(configure_cmd)
+                had_config_cache = config_cache.exists()
+                description = f"Configuring build (attempt {i + 1}/{len(configure_attempts)})"
                 result = run_command_with_progress(
-                    configure_cmd,
+                    [*configure_cmd, f"--cache-file={config_cache}"],
                     cwd=gs_source_dir,
                     check=False,
-                    description=f"Configuring build (attempt {i + 1}/{len(configure_attempts)})",
+                    env=build_env,
+                    description=description,
                 )
+                if result.returncode != 0 and had_config_cache:
+                    # autoconf aborts on a stale cache when the environment
+                    # changed, which says nothing about these flags; retry
+                    # from scratch before giving up on the attempt
+                    config_cache.unlink(missing_ok=True)
+                    log_progress(
+                        f"⚠️  Configure attempt {i + 1} failed with cached results, "
+                        "retrying without them"
+                    )
+                    result = run_command_with_progress(
+                        [*configure_cmd, f"--cache-file={config_cache}"],
+                        cwd=gs_source_dir,
+                        check=False,
+                        env=build_env,
+                        description=f"{description}, without cache",
+                    )
+
                 if result.returncode == 0:
-                    configure_success = True
+                    successful_attempt = i
                     log_progress(f"✅ Configuration successful on attempt {i + 1}")
                     break
                 else:
+                    if result.stdout:
+                        print(f"Configure output (last {OUTPUT_TAIL_LINES} lines):")
+                        print(result.stdout)
+                    # Don't let a failed run's partial results poison the next one
+                    config_cache.unlink(missing_ok=True)
+                    restore_vendored_libs(hidden_libs)
                     log_progress(f"⚠️  Configure attempt {i + 1} failed, trying next...")
 
-            if not configure_success:
+            if successful_attempt is None:
                 raise RuntimeError("All configure attempts failed")
 
-            # Build with optimized parallelism - use more jobs but with memory management
-            cpu_count = os.cpu_count() or 4
-            make_jobs = min(
-                cpu_count + 2, 12
-            )  # Cap at 12 to avoid overwhelming the system
+            # Build with one job per usable CPU; the load-average limit stops
+            # make from spawning more jobs when the machine is already saturated
+            make_jobs = get_cpu_count()
 
             # Don't override CFLAGS in make - they're already set in configure
-            make_cmd = ["make", f"-j{make_jobs}"]
+            make_cmd = ["make", f"-j{make_jobs}", f"--load-average={make_jobs}"]
 
             run_command_with_progress(
                 make_cmd,
                 cwd=gs_source_dir,
+                env=build_env,
                 description=f"Building Ghostscript ({make_jobs} parallel jobs)",
             )
 
@@ -355,77 +1332,43 @@ def build_ghostscript(cleanup=True, use_ram_disk=True):
             run_command_with_progress(
                 ["make", "install"],
                 cwd=gs_source_dir,
+                env=build_env,
                 description="Installing to build directory",
             )
 
             # Copy the main binary to output directory
             gs_binary = build_dir / "bin" / "gs"
-            if gs_binary.exists():
-                final_binary = output_dir / "ghostscript"
-                log_progress("📋 Copying final binary to output directory")
-                shutil.copy2(gs_binary, final_binary)
-
-                # Make executable
-                os.chmod(final_binary, 0o755)
+            if not gs_binary.exists():
+                raise RuntimeError("Ghostscript binary not found after build")
 
-                log_progress(
-                    f"🎉 Standalone Ghostscript binary created: {final_binary.absolute()}"
+            install_final_binary(gs_binary, output_dir, strip)
+
+            # Store the tested prefix so the next run can skip compiling.
+            # Fallback builds are not cached, or the key for the preferred
+            # configuration would keep serving them after a one-off failure.
+            # Hard links are safe here: make install replaces files rather
+            # than rewriting them, and build/ is removed on cleanup anyway
+            if successful_attempt == 0:
+                cache_directory(build_dir, prefix_cache, copy_function=link_or_copy)
+                get_prefix_record_path(prefix_cache).write_text(
+                    "\n".join(configure_attempts[0]) + "\n"
                 )
-
-                # Test the binary
-                log_progress("🧪 Testing binary functionality")
-                result = run_command_with_progress(
-                    [str(final_binary), "--version"],
-                    check=False,
-                    description="Testing binary version",
+                prune_build_cache(
+                    prefix_cache,
+                    {
+                        get_configure_cache_path([cmd[0], *compiler_args, *cmd[1:]])
+                        for cmd in configure_attempts
+                    },
                 )
-                if result.returncode == 0:
-                    log_progress("✅ Binary test successful!")
-
-                    # Clean up build artifacts if requested
-                    if cleanup:
-                        log_progress("🧹 Cleaning up build artifacts")
-                        if build_dir.exists():
-                            shutil.rmtree(build_dir)
-                            log_progress(f"🗑️  Removed build directory: {build_dir}")
-
-                        # Clean up any test files
-                        test_files = [
-                            "test.ps",
-                            "test_original.pdf",
-                            "test_prepress.pdf",
-                            "test_printer.pdf",
-                            "test_ebook.pdf",
-                            "test_screen.pdf",
-                            "test_max_compression.pdf",
-                            "test_info.pdf",
-                        ]
-
-                        cleaned_files = []
-                        for test_file in test_files:
-                            test_path = Path(test_file)
-                            if test_path.exists():
-                                test_path.unlink()
-                                cleaned_files.append(test_file)
-
-                        if cleaned_files:
-                            log_progress(
-                                f"🗑️  Removed test files: {', '.join(cleaned_files)}"
-                            )
-
-                        log_progress("✅ Cleanup completed!")
-                    else:
-                        log_progress(
-                            "📁 Build artifacts retained (use --cleanup to remove)"
-                        )
-
-                else:
-                    log_progress("❌ Binary test failed")
-
             else:
-                raise RuntimeError("Ghostscript binary not found after build")
+                log_progress("⚠️  Built with a fallback configuration, not caching it")
+
+            cleanup_build_artifacts(build_dir, cleanup)
 
     finally:
+        # Let background cache population finish before exiting
+        pool.shutdown(wait=True)
+
         # Clean up RAM disk
         if ram_disk_path and ram_device:
             cleanup_ram_disk(ram_disk_path, ram_device)
@@ -455,15 +1398,44 @@ if __name__ == "__main__":
         action="store_true",
         help="Disable RAM disk optimization (compile on regular disk)",
     )
+    parser.add_argument(
+        "--system-libs",
+        action="store_true",
+        help="Link against system zlib/libjpeg/libpng/freetype/libtiff/fontconfig "
+        "when pkg-config finds them (faster build, binary is no longer standalone)",
+    )
+    parser.add_argument(
+        "--strip",
+        action="store_true",
+        help="Strip symbols from the final binary (and UPX-compress it on Linux "
+        "when upx is installed) to shrink the distributed artifact",
+    )
+    parser.add_argument(
+        "--print-cache-key",
+        action="store_true",
+        help="Print the build cache key (e.g. for CI caching) and exit",
+    )
 
     args = parser.parse_args()
 
+    if args.print_cache_key:
+        configure_attempts = get_configure_attempts(
+            Path("./build").absolute(), args.system_libs and system_libs_available()
+        )
+        print(get_build_cache_key(GS_URL, configure_attempts))
+        sys.exit(0)
+
     # Determine cleanup behavior
     cleanup = not args.no_cleanup
     use_ram_disk = not args.no_ram_disk
 
     try:
-        build_ghostscript(cleanup=cleanup, use_ram_disk=use_ram_disk)
+        build_ghostscript(
+            cleanup=cleanup,
+            use_ram_disk=use_ram_disk,
+            use_system_libs=args.system_libs,
+            strip=args.strip,
+        )
         log_progress("🎉 Build completed successfully!")
     except Exception as e:
         log_progress(f"💥 Build failed: {e}")